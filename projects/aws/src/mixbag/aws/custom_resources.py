@@ -1,13 +1,45 @@
+import hashlib
 import json
 import logging
-import sys
 import traceback
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+def _dumps(obj) -> str:
+    """
+    Serialize obj to JSON, using orjson when it is installed.
+    :param obj: JSON Serializerable Object
+    :return: str
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # e.g. non str keys, which the json module coerces
+            pass
+    return json.dumps(obj)
+
+
+def _default_physical_id(cls: type) -> str:
+    """
+    Derive a physical id from the import path of a handler class. A digest is
+    used rather than the builtin hash() since that is salted per process.
+    :param cls: CustomResourceEventHandler subclass
+    :return: str
+    """
+    return hashlib.sha1(
+        f"{cls.__module__}.{cls.__qualname__}".encode()
+    ).hexdigest()
+
+
 class CustomResourceEventHandler:
     """
     CustomResourceEventHandler is a base class designed to expose a clean
@@ -28,12 +60,27 @@ class CustomResourceEventHandler:
         handler = MyCustomResource()
     """
 
+    # Physical id used when none is given, set once per class
+    default_physical_id: str
+
+    # RequestType => name of the lifecycle method that handles it
+    _dispatch = {
+        "Create": "on_create",
+        "Update": "on_update",
+        "Delete": "on_delete",
+    }
+
     def __init__(self, *, physical_id: Optional[str] = None):
         """
         :param physical_id: str
         """
         self._physical_id = physical_id
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "default_physical_id" not in cls.__dict__:
+            cls.default_physical_id = _default_physical_id(cls)
+
     def __call__(self, event, context):
         """
         :param event:
@@ -42,13 +89,10 @@ class CustomResourceEventHandler:
         """
         logger.info("Starting request.")
         request_type = event["RequestType"]
-        if request_type == "Create":
-            return self.handle_event(self.on_create, event, context)
-        if request_type == "Update":
-            return self.handle_event(self.on_update, event, context)
-        if request_type == "Delete":
-            return self.handle_event(self.on_delete, event, context)
-        raise ValueError("Invalid request type: %s" % request_type)
+        method_name = self._dispatch.get(request_type)
+        if method_name is None:
+            raise ValueError("Invalid request type: %s" % request_type)
+        return self.handle_event(getattr(self, method_name), event, context)
 
     @property
     def physical_id(self) -> str:
@@ -57,9 +101,7 @@ class CustomResourceEventHandler:
         :return: string
         """
         if self._physical_id is None:
-            self._physical_id = str(
-                hash(f"{__file__}::{self.__class__.__name__}")
-            )
+            return self.default_physical_id
         return self._physical_id
 
     def on_create(self, event, context):
@@ -105,22 +147,23 @@ class CustomResourceEventHandler:
         """
         try:
             logger.info("Handling lifecyle event: %s", event["RequestType"])
-            logger.info(json.dumps(self.clean_event(event)))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_dumps(self.clean_event(event)))
             data = method(event, context)
             response = self.success(event, data=data)
         except Exception as exc:  # pylint: disable=broad-except
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-            traceback_string = traceback.format_exception(
-                exc_type, exc_value, exc_traceback
-            )
-            err_msg = json.dumps(
-                {
-                    "errorType": exc_type.__name__,
-                    "errorMessage": str(exc_value),
-                    "stackTrace": traceback_string,
-                }
-            )
-            logger.error(err_msg)
+            if logger.isEnabledFor(logging.ERROR):
+                traceback_string = traceback.format_exception(
+                    type(exc), exc, exc.__traceback__
+                )
+                err_msg = _dumps(
+                    {
+                        "errorType": type(exc).__name__,
+                        "errorMessage": str(exc),
+                        "stackTrace": traceback_string,
+                    }
+                )
+                logger.error(err_msg)
             response = self.failure(event, str(exc))
         return response
 
@@ -173,3 +216,8 @@ class CustomResourceEventHandler:
         :return: get_response output
         """
         return self.get_response("FAILED", event, reason=reason)
+
+
+CustomResourceEventHandler.default_physical_id = _default_physical_id(
+    CustomResourceEventHandler
+)
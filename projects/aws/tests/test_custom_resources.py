@@ -1,8 +1,11 @@
+import json
+import logging
 from typing import Any, Dict
 
 import pytest
 
-from mixbag.aws.custom_resources import CustomResourceEventHandler
+from mixbag.aws import custom_resources
+from mixbag.aws.custom_resources import CustomResourceEventHandler, logger
 
 
 class DummyHandler(CustomResourceEventHandler):
@@ -75,3 +78,91 @@ class TestUnits:
         mocker.patch.object(dummy, "on_create", side_effect=Exception())
         response = dummy(generate_event("Create"), CONTEXT)
         assert response["Status"] == "FAILED"
+
+    def test_event_not_serialized_when_info_disabled(self, mocker):
+        dummy = DummyHandler()
+        clean_event = mocker.spy(dummy, "clean_event")
+        logger.setLevel(logging.WARNING)
+        try:
+            dummy(generate_event("Create"), CONTEXT)
+        finally:
+            logger.setLevel(logging.INFO)
+        assert dummy.created
+        assert not clean_event.called
+
+    def test_failure_not_serialized_when_error_disabled(self, mocker):
+        dummy = DummyHandler()
+        mocker.patch.object(dummy, "on_create", side_effect=Exception("x"))
+        format_exception = mocker.patch("traceback.format_exception")
+        logger.setLevel(logging.CRITICAL)
+        try:
+            response = dummy(generate_event("Create"), CONTEXT)
+        finally:
+            logger.setLevel(logging.INFO)
+        assert response["Status"] == "FAILED"
+        assert response["Reason"] == "x"
+        assert not format_exception.called
+
+    def test_physical_id(self):
+        assert DummyHandler().physical_id == DummyHandler().physical_id
+        assert (
+            DummyHandler().physical_id
+            != CustomResourceEventHandler().physical_id
+        )
+        assert DummyHandler(physical_id="id").physical_id == "id"
+
+        class NamedHandler(DummyHandler):
+            default_physical_id = "named"
+
+        assert NamedHandler().physical_id == "named"
+
+    def test_response(self):
+        dummy = DummyHandler(physical_id="physical")
+        event = generate_event("Create")
+        assert dummy(event, CONTEXT) == {
+            "Status": "SUCCESS",
+            "Reason": None,
+            "PhysicalResourceId": "physical",
+            "RequestId": "request_id",
+            "StackId": "stack_id",
+            "LogicalResourceId": "logical_resource_id",
+            "Data": "id",
+        }
+        assert dummy.failure(event, "reason")["Reason"] == "reason"
+        assert dummy.success(event)["Reason"] is None
+
+    def test_response_physical_id_per_event(self):
+        class PerEventHandler(DummyHandler):
+            current_id = None
+
+            @property
+            def physical_id(self):
+                return self.current_id
+
+            def on_create(self, event, context):
+                self.current_id = event["PhysicalResourceId"]
+
+        handler = PerEventHandler()
+        first, second = generate_event("Create"), generate_event("Create")
+        first["PhysicalResourceId"] = "a"
+        second["PhysicalResourceId"] = "b"
+        assert handler(first, CONTEXT)["PhysicalResourceId"] == "a"
+        assert handler(second, CONTEXT)["PhysicalResourceId"] == "b"
+
+
+@pytest.mark.unit
+class TestDumps:
+    def test_without_orjson(self, mocker):
+        mocker.patch.object(custom_resources, "orjson", None)
+        assert custom_resources._dumps({"a": 1}) == '{"a": 1}'
+
+    def test_with_orjson(self):
+        orjson = pytest.importorskip("orjson")
+        obj = {"a": 1, "b": [1.5, None, "c"]}
+        assert custom_resources._dumps(obj) == orjson.dumps(obj).decode()
+        assert custom_resources._dumps(obj) != json.dumps(obj)
+
+    def test_orjson_fallback(self, mocker):
+        orjson = mocker.patch.object(custom_resources, "orjson")
+        orjson.dumps.side_effect = TypeError()
+        assert custom_resources._dumps({1: 1}) == '{"1": 1}'
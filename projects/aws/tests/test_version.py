@@ -1,8 +1,17 @@
-import toml
-
 from mixbag.aws import __version__
 
 
+def load_pyproject():
+    try:
+        import tomllib
+    except ImportError:  # python < 3.11
+        import toml
+
+        return toml.load("./pyproject.toml")
+    with open("./pyproject.toml", "rb") as pyproject:
+        return tomllib.load(pyproject)
+
+
 def test_version():
-    version = toml.load("./pyproject.toml")["tool"]["poetry"]["version"]
+    version = load_pyproject()["tool"]["poetry"]["version"]
     assert __version__ == version
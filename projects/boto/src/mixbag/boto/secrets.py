@@ -1,6 +1,81 @@
 import json
+import logging
+import os
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
-import boto3
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SECRET_TTL = 300
+
+
+def _secret_ttl() -> int:
+    """
+    Reads MIXBAG_SECRET_TTL, falling back to the default when it isn't a
+    valid integer rather than failing on import.
+    :return: int seconds
+    """
+    value = os.environ.get("MIXBAG_SECRET_TTL")
+    if value is None:
+        return _DEFAULT_SECRET_TTL
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            "Invalid MIXBAG_SECRET_TTL %r, using %d",
+            value,
+            _DEFAULT_SECRET_TTL,
+        )
+        return _DEFAULT_SECRET_TTL
+
+
+# Seconds a fetched secret is reused for before secrets manager is queried
+# again. Set MIXBAG_SECRET_TTL=0 to disable caching.
+_SECRET_TTL = _secret_ttl()
+# (region_name, endpoint_url, secret_id) identifies a cached secret
+_SecretCacheKey = Tuple[Optional[str], Optional[str], str]
+# cache key => (monotonic time fetched, secret string)
+_SECRET_CACHE: Dict[_SecretCacheKey, Tuple[float, str]] = {}
+# cache key => parsed json of the cached secret string
+_PARSED_SECRET_CACHE: Dict[_SecretCacheKey, Any] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_client(
+    service_name: str,
+    region_name: Optional[str] = None,
+    endpoint_url: Optional[str] = None,
+):
+    """
+    Memoized boto client factory. Clients are shared for the lifetime of the
+    process so that warm lambda invocations reuse them.
+
+    Clients are created from a botocore session directly rather than through
+    boto3, which avoids importing the rest of boto3 (resources, dynamodb
+    helpers, etc.). Tests should mock `botocore.session.get_session` rather
+    than `boto3.client`. Clients use TCP keep-alive and standard retries.
+    :param service_name: str
+    :param region_name: Optional str
+    :param endpoint_url: Optional str
+    :return: botocore client
+    """
+    # botocore is imported lazily so that importing this module doesn't
+    # pay the cost of loading it unless a secret is fetched.
+    # pylint: disable=import-outside-toplevel
+    from botocore.config import Config
+    from botocore.session import get_session
+
+    # keep idle connections alive between warm invocations
+    config = Config(
+        tcp_keepalive=True, retries={"mode": "standard", "max_attempts": 3}
+    )
+    return get_session().create_client(
+        service_name,
+        region_name=region_name,
+        endpoint_url=endpoint_url,
+        config=config,
+    )
 
 
 class Secrets:
@@ -11,31 +86,55 @@ class Secrets:
         secret_from_json = secrets.get_secret(json_secret_arn, key="password")
     """
 
-    _secretsmanager = None
-
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        *,
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+    ):
+        """
+        :param region_name: Optional str AWS region of the secrets manager
+        :param endpoint_url: Optional str Override the secrets manager url
+        """
+        self.region_name = region_name
+        self.endpoint_url = endpoint_url
 
     @property
     def secretsmanager(self):
         """
         :return: boto secrets manager client
         """
-        if self._secretsmanager is None:
-            self._secretsmanager = boto3.client("secretsmanager")
-        return self._secretsmanager
+        return _get_client(
+            "secretsmanager",
+            region_name=self.region_name,
+            endpoint_url=self.endpoint_url,
+        )
 
     def get_secret(self, secret_id: str, key: str = None):
         """
+        Fetched secrets are cached in-process for MIXBAG_SECRET_TTL seconds
+        (default 300).
         :param secret_id: ARN of the secret
         :param key: Optional key to the json object
         :return: str
         """
-        secret_string = self.secretsmanager.get_secret_value(
-            SecretId=secret_id
-        )["SecretString"]
+        cache_key = (self.region_name, self.endpoint_url, secret_id)
+        now = time.monotonic()
+        cached = _SECRET_CACHE.get(cache_key)
+        if cached is not None and now - cached[0] < _SECRET_TTL:
+            secret_string = cached[1]
+        else:
+            secret_string = self.secretsmanager.get_secret_value(
+                SecretId=secret_id
+            )["SecretString"]
+            _SECRET_CACHE[cache_key] = (now, secret_string)
+            _PARSED_SECRET_CACHE.pop(cache_key, None)
         if key:
-            return json.loads(secret_string)[key]
+            parsed = _PARSED_SECRET_CACHE.get(cache_key)
+            if parsed is None:
+                parsed = json.loads(secret_string)
+                _PARSED_SECRET_CACHE[cache_key] = parsed
+            return parsed[key]
         return secret_string
 
 
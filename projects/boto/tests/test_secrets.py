@@ -1,10 +1,29 @@
 from unittest import mock
 
-from mixbag.boto.secrets import secrets
+import pytest
+
+from mixbag.boto import secrets as secrets_module
+from mixbag.boto.secrets import Secrets, _get_client, secrets
+
+
+@pytest.fixture(autouse=True)
+def clear_secret_cache():
+    secrets_module._SECRET_CACHE.clear()
+    secrets_module._PARSED_SECRET_CACHE.clear()
+    yield
+    secrets_module._SECRET_CACHE.clear()
+    secrets_module._PARSED_SECRET_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    _get_client.cache_clear()
+    yield
+    _get_client.cache_clear()
 
 
 def test_get_secret(mocker):
-    boto_client = mocker.patch("boto3.client")
+    boto_client = mocker.patch("mixbag.boto.secrets._get_client")
     secret_arn_value = "fake"
     secret = secrets.get_secret(secret_arn_value)
     assert boto_client.called
@@ -26,3 +45,79 @@ def test_get_secret_with_key(mocker):
     secret = secrets.get_secret(secret_arn_value, key="password")
     assert boto_client.get_secret_value.called
     assert secret == password
+
+
+def test_client_is_cached(mocker):
+    get_session = mocker.patch("botocore.session.get_session")
+    boto_client = get_session.return_value.create_client
+    assert Secrets().secretsmanager is Secrets().secretsmanager
+    boto_client.assert_called_once_with(
+        "secretsmanager",
+        region_name=None,
+        endpoint_url=None,
+        config=mocker.ANY,
+    )
+    assert Secrets(region_name="us-west-2").secretsmanager
+    assert boto_client.call_count == 2
+
+
+def test_get_secret_is_cached(mocker):
+    boto_client = mocker.patch("mixbag.boto.secrets.Secrets.secretsmanager")
+    boto_client.get_secret_value = mock.MagicMock(
+        return_value={"SecretString": '{"user": "me", "password": "pw"}'}
+    )
+    json_loads = mocker.spy(secrets_module.json, "loads")
+    assert secrets.get_secret("fake", key="user") == "me"
+    assert secrets.get_secret("fake", key="password") == "pw"
+    assert boto_client.get_secret_value.call_count == 1
+    assert json_loads.call_count == 1
+
+
+def test_get_secret_cache_per_region(mocker):
+    clients = {
+        region: mock.MagicMock(
+            get_secret_value=mock.MagicMock(
+                return_value={"SecretString": region}
+            )
+        )
+        for region in ("us-east-1", "eu-west-1")
+    }
+    mocker.patch(
+        "mixbag.boto.secrets._get_client",
+        side_effect=lambda service, region_name, endpoint_url: clients[
+            region_name
+        ],
+    )
+    assert Secrets(region_name="us-east-1").get_secret("db") == "us-east-1"
+    assert Secrets(region_name="eu-west-1").get_secret("db") == "eu-west-1"
+    assert Secrets(region_name="us-east-1").get_secret("db") == "us-east-1"
+    for client in clients.values():
+        assert client.get_secret_value.call_count == 1
+
+
+def test_get_secret_cache_expires(mocker):
+    boto_client = mocker.patch("mixbag.boto.secrets.Secrets.secretsmanager")
+    boto_client.get_secret_value = mock.MagicMock(
+        return_value={"SecretString": "value"}
+    )
+    mocker.patch.object(secrets_module, "_SECRET_TTL", 0)
+    assert secrets.get_secret("fake") == secrets.get_secret("fake")
+    assert boto_client.get_secret_value.call_count == 2
+
+
+def test_secret_ttl(monkeypatch, caplog):
+    monkeypatch.delenv("MIXBAG_SECRET_TTL", raising=False)
+    assert secrets_module._secret_ttl() == 300
+    monkeypatch.setenv("MIXBAG_SECRET_TTL", "60")
+    assert secrets_module._secret_ttl() == 60
+    monkeypatch.setenv("MIXBAG_SECRET_TTL", "5m")
+    assert secrets_module._secret_ttl() == 300
+    assert "Invalid MIXBAG_SECRET_TTL '5m'" in caplog.text
+
+
+def test_client_config(mocker):
+    get_session = mocker.patch("botocore.session.get_session")
+    _get_client("secretsmanager")
+    config = get_session.return_value.create_client.call_args[1]["config"]
+    assert config.tcp_keepalive
+    assert config.retries == {"mode": "standard", "max_attempts": 3}
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from os import linesep
 from sys import version_info
 
@@ -215,8 +216,28 @@ class Chalk(object):
         return self
 
     def __call__(self, txt, reset=True, new_line=False, **kwargs):
-        style = self.get_style(**kwargs)
-        return style(txt, reset=reset, new_line=new_line)
+        prefix = None
+        # the cache builds styles with Chalk.get_style, so subclasses that
+        # override it always build their own
+        if type(self).get_style is Chalk.get_style:
+            try:
+                # value types are part of the key since 1, 1.0 and True hash
+                # the same but aren't treated the same by get_style
+                options = tuple(
+                    (key, type(value), value) for key, value in kwargs.items()
+                )
+                prefix = _style_prefix(self.style.value, options)
+            except TypeError:
+                # unhashable keyword values can't be cached
+                pass
+        if prefix is None:
+            prefix = str(self.get_style(**kwargs))
+        txt = prefix + to_str(txt)
+        if reset:
+            txt += RESET
+        if new_line:
+            txt += linesep
+        return txt
 
     def get_style(self, **kwargs):
         """Helper method to ensure that the instantiated style isn't impacted
@@ -248,6 +269,16 @@ class Chalk(object):
         return self.__class__(self.style.clone())
 
 
+@lru_cache(maxsize=None)
+def _style_prefix(value, options):
+    """Returns the escape sequence produced by Chalk.get_style for the given
+    style value and keyword options, so that repeated calls to a Chalk
+    instance don't rebuild the same styles.
+    """
+    kwargs = {key: option for key, _, option in options}
+    return str(Chalk(Style(value)).get_style(**kwargs))
+
+
 def eraser(new_line=False):
     """Equivalent to running bash 'clear' command"""
     output = "\x1b[2J\x1b[0;0H"
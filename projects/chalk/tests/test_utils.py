@@ -1,4 +1,5 @@
 import unittest
+from os import linesep
 
 from mixbag import chalk
 from mixbag.chalk.utils import (
@@ -180,9 +181,40 @@ class TestChalkUtils(unittest.TestCase):
         expected = "\x1b[37;40mhello\x1b[0m"
         self.assertEqual(actual, expected)
 
+    def test_chalk_call_repeated_options(self):
+        white = Chalk("white")
+        expected = "\x1b[37;1;4mfoo\x1b[0m"
+        self.assertEqual(white("foo", bold=True, underline=True), expected)
+        self.assertEqual(white("foo", bold=True, underline=True), expected)
+        self.assertEqual(
+            white("foo", reset=False, new_line=True, bold=True),
+            "\x1b[37;1mfoo" + linesep,
+        )
+        white += FontFormat("blink")
+        self.assertEqual(white("foo"), "\x1b[37;5mfoo\x1b[0m")
+
+    def test_chalk_call_unhashable_option(self):
+        actual = Chalk("white")("foo", bold=[1])
+        self.assertEqual(actual, "\x1b[37;1mfoo\x1b[0m")
+
+    def test_chalk_call_options_of_equal_hash(self):
+        white = Chalk("white")
+        self.assertEqual(white("foo", background=1), "\x1b[37;41mfoo\x1b[0m")
+        with self.assertRaises(ValueError):
+            white("foo", background=True)
+
+    def test_chalk_call_subclass_get_style(self):
+        class BoldChalk(Chalk):
+            def get_style(self, **kwargs):
+                kwargs["bold"] = True
+                return super().get_style(**kwargs)
+
+        self.assertEqual(Chalk("red")("x"), "\x1b[31mx\x1b[0m")
+        self.assertEqual(BoldChalk("red")("x"), "\x1b[31;1mx\x1b[0m")
+
     def test_format_txt_accepts_unicode(self):
         actual = chalk.white("abcd" + "つ", background="black")
-        expected = u"\x1b[37;40mabcd\u3064\x1b[0m"
+        expected = "\x1b[37;40mabcd\u3064\x1b[0m"
         self.assertEqual(actual, expected)
 
     def test_existence_of_needed_functions(self):
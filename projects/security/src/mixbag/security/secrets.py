@@ -4,6 +4,7 @@ mixbag.security.secrets
 Provides more semantically relevant names to commonly used functions from the
 built-in secrets module.
 """
+
 import hashlib
 import hmac
 import secrets as _secrets
@@ -28,8 +29,27 @@ def generate_token(n_bytes=16):
     return _secrets.token_urlsafe(nbytes=n_bytes)
 
 
+def derive_key(
+    salt: str, key: str, *, algorithm: Callable = hashlib.sha256
+) -> bytes:
+    """
+    Derive the hmac key used by salted_hmac from a secret key and a salt.
+    :param salt: str
+    :param key: str
+    :param algorithm:
+    :return: bytes
+    """
+    # We need to generate a derived key from our base key.  We can do this by
+    # passing the salt and our base key through a pseudo-random function.
+    # If len(salt + key) > block size of the hash algorithm, this is
+    # redundant and could be replaced by derived_key = salt + key, since the
+    # hmac module does the same thing for keys longer than the block size.
+    # However, we should ensure that we *always* do this.
+    return algorithm(salt.encode() + key.encode()).digest()
+
+
 def salted_hmac(
-    salt: str, value: str, key: str, *, algorithm: Callable = hashlib.sha1
+    salt: str, value: str, key: str, *, algorithm: Callable = hashlib.sha256
 ) -> hmac.HMAC:
     """
     Generate a salted hmac given a secret key, a variable salt and the value to
@@ -40,13 +60,7 @@ def salted_hmac(
     :param algorithm:
     :return: hmac.HMAC
     """
-    # We need to generate a derived key from our base key.  We can do this by
-    # passing the salt and our base key through a pseudo-random function.
-    derived_key: bytes = algorithm(salt.encode() + key.encode()).digest()
-    # If len(salt + key) > block size of the hash algorithm, the above
-    # line is redundant and could be replaced by derived_key = salt + key,
-    # since the hmac module does the same thing for keys longer than the block
-    # size. However, we should ensure that we *always* do this.
+    derived_key = derive_key(salt, key, algorithm=algorithm)
     return hmac.new(derived_key, msg=value.encode(), digestmod=algorithm)
 
 
@@ -1,14 +1,37 @@
 # pylint: disable=no-self-use
-import base64
+import binascii
 import hashlib
+import hmac
 import re
 import time
 from datetime import timedelta
-from typing import Callable, Optional, Union
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Union
 
-from mixbag.security.secrets import compare_digest, salted_hmac
+from mixbag.security.secrets import compare_digest, derive_key
 
-_UNSAFE_SEP = re.compile(r"^[A-z0-9-_=]*$")
+_B64_URLSAFE_ENCODE = bytes.maketrans(b"+/", b"-_")
+_B64_URLSAFE_DECODE = bytes.maketrans(b"-_", b"+/")
+_B62_ALPHABET = (
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+_B62_INDEX = {char: index for index, char in enumerate(_B62_ALPHABET)}
+_UNSAFE_SEP = re.compile(r"^[A-Za-z0-9\-_=]*$")
+
+
+@lru_cache(maxsize=64)
+def _validate_sep(sep: str) -> None:
+    """
+    Ensure the separator can't be confused with the url safe base 64 encoded
+    token parts.
+    :param sep: str
+    :return: None
+    """
+    if _UNSAFE_SEP.match(sep):
+        raise ValueError(
+            "Unsafe Signer separator: %r (cannot be empty or consist of "
+            "only A-Za-z0-9-_=)" % sep,
+        )
 
 
 def b64_encode(value: bytes) -> bytes:
@@ -17,7 +40,11 @@ def b64_encode(value: bytes) -> bytes:
     :param value: bytes
     :return: bytes
     """
-    return base64.urlsafe_b64encode(value).strip(b"=")
+    return (
+        binascii.b2a_base64(value, newline=False)
+        .translate(_B64_URLSAFE_ENCODE)
+        .rstrip(b"=")
+    )
 
 
 def b64_decode(value: bytes) -> bytes:
@@ -27,7 +54,44 @@ def b64_decode(value: bytes) -> bytes:
     :return: bytes
     """
     pad = b"=" * (-len(value) % 4)
-    return base64.urlsafe_b64decode(value + pad)
+    return binascii.a2b_base64((value + pad).translate(_B64_URLSAFE_DECODE))
+
+
+def b62_encode(value: int) -> bytes:
+    """
+    Base 62 encoding of a non-negative int
+    :param value: int
+    :return: bytes
+    """
+    if value < 0:
+        raise ValueError("Cannot base 62 encode a negative int: %d" % value)
+    output = bytearray()
+    while True:
+        value, remainder = divmod(value, 62)
+        output.append(_B62_ALPHABET[remainder])
+        if not value:
+            break
+    output.reverse()
+    return bytes(output)
+
+
+def b62_decode(value: bytes) -> int:
+    """
+    Base 62 decoding of a non-negative int
+    :param value: bytes
+    :return: int
+    """
+    if not value:
+        raise ValueError("Cannot base 62 decode an empty value")
+    output = 0
+    for char in value:
+        try:
+            output = output * 62 + _B62_INDEX[char]
+        except KeyError as exc:
+            raise ValueError(
+                "Invalid base 62 character: %r" % chr(char)
+            ) from exc
+    return output
 
 
 MaxAge = Union[timedelta, int, float]
@@ -43,8 +107,34 @@ def is_valid_timestamp(*, timestamp: int, max_age: Optional[MaxAge]):
         return True
     if isinstance(max_age, timedelta):
         max_age = max_age.total_seconds()
-    delta = abs(int(time.time()) - timestamp)
-    return delta < max_age
+    # timestamps from the future are not valid
+    age = time.time_ns() // 1_000_000_000 - timestamp
+    return 0 <= age < max_age
+
+
+def _hmac_digest(algorithm: Callable) -> Union[str, Callable]:
+    """
+    Returns the hashlib name of the given algorithm, since hmac.digest only
+    takes its C fast path for named digests, or the algorithm itself when
+    hashlib can't construct it by name.
+    :param algorithm: callable hash constructor e.g. hashlib.sha256
+    :return: Union[str, Callable]
+    """
+    name = algorithm().name
+    try:
+        hashlib.new(name)
+    except ValueError:
+        return algorithm
+    return name
+
+
+def _default_salt(cls: type) -> str:
+    """
+    Generates the default salt for a signer class.
+    :param cls: Signer subclass
+    :return: str module path dot class name
+    """
+    return f"{cls.__module__}.{cls.__name__}"
 
 
 class BadToken(Exception):
@@ -66,8 +156,15 @@ class Signer:
         signer = Signer(key="somesupersecretvalue", salt="validate-email")
         token: str = signer.sign(user_id)
         assert user_id == signer.validate(token, max_age=300)
+
+    Tokens are signed with SHA256 unless an algorithm is given. Subclasses can
+    change the default by overriding DEFAULT_ALGORITHM.
     """
 
+    DEFAULT_ALGORITHM: Callable = hashlib.sha256
+    # Salt used when none is given, set per class: module path dot class name
+    default_salt: str
+
     def __init__(
         self,
         *,
@@ -75,33 +172,39 @@ class Signer:
         sep=".",
         byte_order: Optional[str] = None,
         salt: Optional[str] = None,
-        algorithm: Callable = hashlib.sha1,
+        algorithm: Optional[Callable] = None,
     ):
         """
         :param key: str Secret key
         :param sep: str Seperator for token parts
-        :param byte_order: str big | little
+        :param byte_order: str big | little - no longer used, timestamps are
+            base 62 encoded
         :param salt: Optional str
-        :param algorithm: Hashlib algorithm defuault SHA1
+        :param algorithm: Hashlib algorithm default DEFAULT_ALGORITHM
         """
         self.key = key
         self.sep = sep
         self.byte_order = byte_order or "big"
-        if _UNSAFE_SEP.match(self.sep):
-            raise ValueError(
-                "Unsafe Signer separator: %r (cannot be empty or consist of "
-                "only A-z0-9-_=)" % sep,
-            )
+        _validate_sep(self.sep)
         self.salt = salt or self.default_salt
-        self.algorithm = algorithm
+        self.algorithm = algorithm or self.DEFAULT_ALGORITHM
+        self._derive()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "default_salt" not in cls.__dict__:
+            cls.default_salt = _default_salt(cls)
 
-    @property
-    def default_salt(self) -> str:
+    def _derive(self):
         """
-        Generates the default solt for the signer instance.
-        :return: str module path dot class name
+        Derive the hmac key and digest from the current key, salt and
+        algorithm so that signing doesn't re-encode and re-hash the key.
         """
-        return f"{self.__class__.__module__}.{self.__class__.__name__}"
+        self._derived_from = (self.key, self.salt, self.algorithm)
+        self._derived_key = derive_key(
+            self.salt, self.key, algorithm=self.algorithm
+        )
+        self._digest = _hmac_digest(self.algorithm)
 
     def signature(self, value: str, timestamp: int) -> str:
         """
@@ -109,26 +212,35 @@ class Signer:
         :param timestamp: int Seconds since epoch
         :return:
         """
-        unsigned_value = f"{value}.{timestamp}"
         return b64_encode(
-            salted_hmac(
-                self.salt, unsigned_value, self.key, algorithm=self.algorithm
-            ).digest()
+            self._signature_bytes(value.encode(), timestamp)
         ).decode()
 
+    def _signature_bytes(self, value: bytes, timestamp: int) -> bytes:
+        """
+        :param value: bytes Encoded value to sign
+        :param timestamp: int Seconds since epoch
+        :return: bytes raw hmac digest
+        """
+        if self._derived_from != (self.key, self.salt, self.algorithm):
+            # key, salt or algorithm were reassigned since the last derive
+            self._derive()
+        unsigned_value = b"%s.%d" % (value, timestamp)
+        return hmac.digest(self._derived_key, unsigned_value, self._digest)
+
     def encode_int(self, value: int) -> bytes:
         """
         :param value: int
         :return: bytes
         """
-        return b64_encode(value.to_bytes(8, self.byte_order))
+        return b62_encode(value)
 
     def decode_int(self, value: bytes) -> int:
         """
         :param value: bytes
         :return: int
         """
-        return int.from_bytes(b64_decode(value), self.byte_order)
+        return b62_decode(value)
 
     @staticmethod
     def encode_value(value: str) -> bytes:
@@ -176,6 +288,9 @@ class Signer:
         valid.
         :param token: str Token to parse and validate
         :param max_age: Optional Seconds the token is allow to be valid for
+        :param timestamp_validator: Callable taking timestamp and max_age
+        :param signature_validator: Callable comparing the token's signature
+            with the expected one, both as url safe base 64 encoded str
         :return: str Value that was originally signed
         """
         if self.sep not in token:
@@ -184,10 +299,48 @@ class Signer:
             encoded_value, encoded_timestamp, sig = token.split(self.sep)
         except ValueError as exc:
             raise BadToken("Invalid token structure", token=token) from exc
-        timestamp = self.decode_int(encoded_timestamp.encode())
-        value = self.decode_value(encoded_value.encode())
+        try:
+            timestamp = self.decode_int(encoded_timestamp.encode())
+            value = self.decode_value(encoded_value.encode())
+        except ValueError as exc:
+            raise BadToken("Invalid token encoding", token=token) from exc
         if not timestamp_validator(timestamp=timestamp, max_age=max_age):
             raise BadToken("Token has expired", token=token)
         if not signature_validator(sig, self.signature(value, timestamp)):
             raise BadToken("Signatures do not match", token=token)
         return value
+
+    def validate_many(
+        self,
+        tokens: Iterable[str],
+        *,
+        max_age: Optional[MaxAge] = None,
+        timestamp_validator: Callable = is_valid_timestamp,
+        signature_validator: Callable = compare_digest,
+    ) -> List[Union[str, BadToken]]:
+        """
+        Validate a batch of tokens. Unlike validate, invalid tokens don't
+        raise; their BadToken is returned in place of the value.
+        :param tokens: Iterable[str] Tokens to parse and validate
+        :param max_age: Optional Seconds the tokens are allowed to be valid for
+        :param timestamp_validator: see validate
+        :param signature_validator: see validate
+        :return: List[str | BadToken] in the same order as tokens
+        """
+        results: List[Union[str, BadToken]] = []
+        for token in tokens:
+            try:
+                results.append(
+                    self.validate(
+                        token,
+                        max_age=max_age,
+                        timestamp_validator=timestamp_validator,
+                        signature_validator=signature_validator,
+                    )
+                )
+            except BadToken as exc:
+                results.append(exc)
+        return results
+
+
+Signer.default_salt = _default_salt(Signer)
@@ -1,8 +1,18 @@
+import hashlib
+import time
 from datetime import timedelta
 
 import pytest
 
-from mixbag.security.signing import BadToken, Signer
+from mixbag.security.signing import (
+    BadToken,
+    Signer,
+    b62_decode,
+    b62_encode,
+    b64_decode,
+    b64_encode,
+    is_valid_timestamp,
+)
 
 
 @pytest.fixture()
@@ -54,3 +64,130 @@ class TestSigner:
         with pytest.raises(ValueError) as exc:
             Signer(key="fake", sep="a")
         assert str(exc.value).startswith("Unsafe Signer separator")
+
+    def test_separator_outside_base64_alphabet(self):
+        signer = Signer(key="fake", sep="^")
+        assert signer.validate(signer.sign("value")) == "value"
+
+    def test_default_algorithm(self):
+        class SHA1Signer(Signer):
+            DEFAULT_ALGORITHM = hashlib.sha1
+
+        assert Signer(key="fake").algorithm is hashlib.sha256
+        assert SHA1Signer(key="fake").algorithm is hashlib.sha1
+        assert Signer(key="fake", algorithm=hashlib.md5).algorithm is (
+            hashlib.md5
+        )
+
+    def test_tampered_token(self, signer: Signer):
+        value, timestamp, _ = signer.sign("value").split(signer.sep)
+        forged = signer.sep.join(
+            [value, timestamp, Signer(key="other").signature("value", 1)]
+        )
+        with pytest.raises(BadToken) as exc:
+            signer.validate(forged)
+        assert str(exc.value) == "Signatures do not match"
+
+    def test_validation_token_encoding(self, signer: Signer):
+        value, _, sig = signer.sign("value").split(signer.sep)
+        with pytest.raises(BadToken) as exc:
+            signer.validate(signer.sep.join([value, "not!b62", sig]))
+        assert str(exc.value) == "Invalid token encoding"
+
+    def test_default_salt(self):
+        class SubSigner(Signer):
+            pass
+
+        class SaltedSigner(Signer):
+            default_salt = "salted"
+
+        assert Signer(key="fake").salt == "mixbag.security.signing.Signer"
+        assert SubSigner(key="fake").salt == f"{__name__}.SubSigner"
+        assert SaltedSigner(key="fake").salt == "salted"
+        assert Signer(key="fake", salt="given").salt == "given"
+
+    def test_validate_many(self, signer: Signer):
+        values = ["foo", "bar"]
+        tokens = [signer.sign(value) for value in values]
+        results = signer.validate_many([tokens[0], "nosep", tokens[1]])
+        assert results[0] == "foo"
+        assert isinstance(results[1], BadToken)
+        assert results[1].token == "nosep"
+        assert results[2] == "bar"
+
+    def test_sign_uses_hooks(self):
+        class HookedSigner(Signer):
+            @staticmethod
+            def encode_value(value: str) -> bytes:
+                return b"encoded"
+
+            def signature(self, value: str, timestamp: int) -> str:
+                return "signature"
+
+        token = HookedSigner(key="fake").sign("value", 1)
+        assert token == "encoded.1.signature"
+
+    def test_validate_uses_hooks(self, signer: Signer, mocker):
+        class ReversingSigner(Signer):
+            @staticmethod
+            def encode_value(value: str) -> bytes:
+                return b64_encode(value[::-1].encode())
+
+            @staticmethod
+            def decode_value(value: bytes) -> str:
+                return b64_decode(value).decode()[::-1]
+
+        reversing = ReversingSigner(key="fake")
+        assert reversing.validate(reversing.sign("value")) == "value"
+        validator = mocker.Mock(return_value=True)
+        signer.validate(signer.sign("value"), signature_validator=validator)
+        sig, expected = validator.call_args[0]
+        assert isinstance(sig, str)
+        assert isinstance(expected, str)
+
+    def test_reassigned_key(self, signer: Signer):
+        token = signer.sign("value")
+        signer.key = "new"
+        with pytest.raises(BadToken) as exc:
+            signer.validate(token)
+        assert str(exc.value) == "Signatures do not match"
+        assert signer.validate(signer.sign("value")) == "value"
+        assert Signer(key="new").validate(signer.sign("value")) == "value"
+
+    def test_unnamed_algorithm(self):
+        class CustomSha:
+            name = "custom-sha"
+
+            def __init__(self, data=b""):
+                self._hash = hashlib.sha256(data)
+
+            def __getattr__(self, attr):
+                return getattr(self._hash, attr)
+
+        signer = Signer(key="key", algorithm=CustomSha)
+        named = Signer(key="key", algorithm=hashlib.sha256)
+        token = signer.sign("value", timestamp=1)
+        assert token == named.sign("value", timestamp=1)
+
+
+@pytest.mark.unit
+def test_is_valid_timestamp():
+    now = int(time.time())
+    assert is_valid_timestamp(timestamp=now, max_age=None)
+    assert is_valid_timestamp(timestamp=now - 10, max_age=100)
+    assert not is_valid_timestamp(timestamp=now - 100, max_age=10)
+    assert not is_valid_timestamp(timestamp=now + 100, max_age=1000)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [0, 1, 61, 62, 1618033988, 2**40])
+def test_b62_roundtrip(value):
+    assert b62_decode(b62_encode(value)) == value
+
+
+@pytest.mark.unit
+def test_b62_invalid():
+    with pytest.raises(ValueError):
+        b62_encode(-1)
+    with pytest.raises(ValueError):
+        b62_decode(b"")